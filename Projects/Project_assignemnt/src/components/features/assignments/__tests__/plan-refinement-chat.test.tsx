@@ -1,4 +1,4 @@
-import { render, screen, fireEvent, waitFor } from '@testing-library/react';
+import { render, screen, fireEvent } from '@testing-library/react';
 import { PlanRefinementChat } from '../plan-refinement-chat';
 import type { AssignmentPlan, RefinementMessage } from '@/types';
 import { api } from '@/lib/trpc';
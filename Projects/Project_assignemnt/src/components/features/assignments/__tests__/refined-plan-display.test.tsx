@@ -1,4 +1,4 @@
-import { render, screen, fireEvent } from '@testing-library/react';
+import { render, screen } from '@testing-library/react';
 import { RefinedPlanDisplay } from '../refined-plan-display';
 import type { AssignmentPlan, SubTask } from '@/types';
 
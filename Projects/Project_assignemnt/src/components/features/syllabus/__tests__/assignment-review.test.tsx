@@ -1,9 +1,9 @@
 import React from 'react';
-import { render, screen, fireEvent, waitFor, within } from '@testing-library/react';
+import { render, screen, waitFor, within } from '@testing-library/react';
 import userEvent from '@testing-library/user-event';
 import { toast } from 'sonner';
 import { AssignmentReview } from '../assignment-review';
-import type { AIParsingResult, ParsedAssignment } from '@/types';
+import type { AIParsingResult } from '@/types';
 
 // Mock Next.js router
 const mockPush = jest.fn();
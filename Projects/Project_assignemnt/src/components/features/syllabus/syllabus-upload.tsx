@@ -117,6 +117,7 @@ export function SyllabusUpload({ onSuccess }: SyllabusUploadProps) {
       onSuccess?.();
     },
     onError: (error) => {
+      // Also raised when assignments were parsed but none could be saved
       toast.error(error.message || 'Failed to upload syllabus');
     },
   });
@@ -16,6 +16,37 @@ function getOpenAIClient(): OpenAI {
   return openai;
 }
 
+/**
+ * Map a raw OpenAI/client error onto a user-facing error message
+ */
+function categorizeOpenAIError(
+  error: Error,
+  options: {
+    timeoutMessage: string;
+    invalidFormatMarkers: string[];
+    invalidFormatMessage: string;
+  }
+): Error {
+  const { message } = error;
+
+  if (message.includes('API key') || message.includes('401')) {
+    return new Error('OpenAI API authentication failed: Please check your API key configuration');
+  }
+  if (message.includes('rate limit') || message.includes('429')) {
+    return new Error('OpenAI API rate limit exceeded. Please try again in a few minutes.');
+  }
+  if (message.includes('timeout') || message.includes('ETIMEDOUT')) {
+    return new Error(options.timeoutMessage);
+  }
+  if (options.invalidFormatMarkers.some((marker) => message.includes(marker))) {
+    return new Error(options.invalidFormatMessage);
+  }
+  if (message.includes('quota') || message.includes('billing')) {
+    return new Error('OpenAI API quota exceeded. Please check your account billing.');
+  }
+  return error;
+}
+
 // Schema for parsed assignment from AI response
 export const ParsedAssignmentSchema = z.object({
   title: z.string().min(1),
@@ -144,25 +175,13 @@ Only return valid JSON. Do not include any other text or markdown formatting.`;
     }
     
     if (error instanceof Error) {
-      // Enhanced error categorization with specific handling
-      if (error.message.includes('API key') || error.message.includes('401')) {
-        throw new Error('OpenAI API authentication failed: Please check your API key configuration');
-      }
-      if (error.message.includes('rate limit') || error.message.includes('429')) {
-        throw new Error('OpenAI API rate limit exceeded. Please try again in a few minutes.');
-      }
-      if (error.message.includes('timeout') || error.message.includes('ETIMEDOUT')) {
-        throw new Error('OpenAI API request timed out. Please try again with a shorter syllabus.');
-      }
-      if (error.message.includes('Invalid JSON') || error.message.includes('parse')) {
-        throw new Error('AI returned invalid response format. Please try again with clearer syllabus text.');
-      }
-      if (error.message.includes('quota') || error.message.includes('billing')) {
-        throw new Error('OpenAI API quota exceeded. Please check your account billing.');
-      }
-      throw error;
+      throw categorizeOpenAIError(error, {
+        timeoutMessage: 'OpenAI API request timed out. Please try again with a shorter syllabus.',
+        invalidFormatMarkers: ['Invalid JSON', 'parse'],
+        invalidFormatMessage: 'AI returned invalid response format. Please try again with clearer syllabus text.',
+      });
     }
-    
+
     throw new Error('Failed to parse syllabus with AI: Unexpected error occurred');
   }
 }
@@ -346,23 +365,11 @@ You are a Socratic Learning Agent, a specialized AI tutor. Your entire purpose i
     console.error('OpenAI structured prompt generation error:', error);
     
     if (error instanceof Error) {
-      // Enhanced error categorization with specific handling
-      if (error.message.includes('API key') || error.message.includes('401')) {
-        throw new Error('OpenAI API authentication failed: Please check your API key configuration');
-      }
-      if (error.message.includes('rate limit') || error.message.includes('429')) {
-        throw new Error('OpenAI API rate limit exceeded. Please try again in a few minutes.');
-      }
-      if (error.message.includes('timeout') || error.message.includes('ETIMEDOUT')) {
-        throw new Error('OpenAI API request timed out. Please try again with shorter instructions.');
-      }
-      if (error.message.includes('Invalid XML') || error.message.includes('XML response format')) {
-        throw new Error('AI returned invalid response format. Please try again with clearer instructions.');
-      }
-      if (error.message.includes('quota') || error.message.includes('billing')) {
-        throw new Error('OpenAI API quota exceeded. Please check your account billing.');
-      }
-      throw error;
+      throw categorizeOpenAIError(error, {
+        timeoutMessage: 'OpenAI API request timed out. Please try again with shorter instructions.',
+        invalidFormatMarkers: ['Invalid XML', 'XML response format'],
+        invalidFormatMessage: 'AI returned invalid response format. Please try again with clearer instructions.',
+      });
     }
     
     throw new Error('Failed to generate structured prompt with AI: Unexpected error occurred');
@@ -476,23 +483,11 @@ Only return valid JSON. Do not include any other text or markdown formatting.`;
     }
     
     if (error instanceof Error) {
-      // Enhanced error categorization with specific handling
-      if (error.message.includes('API key') || error.message.includes('401')) {
-        throw new Error('OpenAI API authentication failed: Please check your API key configuration');
-      }
-      if (error.message.includes('rate limit') || error.message.includes('429')) {
-        throw new Error('OpenAI API rate limit exceeded. Please try again in a few minutes.');
-      }
-      if (error.message.includes('timeout') || error.message.includes('ETIMEDOUT')) {
-        throw new Error('OpenAI API request timed out. Please try again with shorter instructions.');
-      }
-      if (error.message.includes('Invalid JSON') || error.message.includes('parse')) {
-        throw new Error('AI returned invalid response format. Please try again with clearer assignment text.');
-      }
-      if (error.message.includes('quota') || error.message.includes('billing')) {
-        throw new Error('OpenAI API quota exceeded. Please check your account billing.');
-      }
-      throw error;
+      throw categorizeOpenAIError(error, {
+        timeoutMessage: 'OpenAI API request timed out. Please try again with shorter instructions.',
+        invalidFormatMarkers: ['Invalid JSON', 'parse'],
+        invalidFormatMessage: 'AI returned invalid response format. Please try again with clearer assignment text.',
+      });
     }
     
     throw new Error('Failed to generate sub-tasks with AI: Unexpected error occurred');
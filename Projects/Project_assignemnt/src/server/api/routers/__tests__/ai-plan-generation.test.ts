@@ -1,6 +1,4 @@
 import { describe, expect, it, beforeEach, jest } from '@jest/globals';
-import { TRPCError } from '@trpc/server';
-import type { createServerClient } from '@supabase/ssr';
 // Mock the entire openai module
 const mockGenerateSubTasksWithAI = jest.fn();
 const mockValidateOpenAIConfig = jest.fn();
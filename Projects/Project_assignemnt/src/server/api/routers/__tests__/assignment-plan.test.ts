@@ -1,6 +1,4 @@
-import { TRPCError } from '@trpc/server';
 import { assignmentRouter } from '../assignment';
-import { createTRPCContext } from '../../trpc';
 
 // Mock Supabase
 const mockSupabaseClient = {
@@ -1,6 +1,4 @@
 import { describe, it, expect, beforeEach, jest } from '@jest/globals';
-import { z } from 'zod';
-import { TRPCError } from '@trpc/server';
 import { assignmentRouter } from '../assignment';
 
 // Mock Supabase
@@ -8,6 +6,8 @@ const mockSupabase = {
   from: jest.fn(() => mockSupabase),
   select: jest.fn(() => mockSupabase),
   eq: jest.fn(() => mockSupabase),
+  gte: jest.fn(() => mockSupabase),
+  lte: jest.fn(() => mockSupabase),
   insert: jest.fn(() => mockSupabase),
   update: jest.fn(() => mockSupabase),
   delete: jest.fn(() => mockSupabase),
@@ -317,12 +317,18 @@ describe('Assignment Router', () => {
       // Mock class ownership validation for both classes
       mockSupabase.single
         .mockResolvedValueOnce({ data: mockClass1, error: null })
-        .mockResolvedValueOnce({ data: mockClass2, error: null })
-        // Mock duplicate checks (no duplicates found)
-        .mockResolvedValueOnce({ data: [], error: null })
-        .mockResolvedValueOnce({ data: [], error: null })
-        // Mock batch insert
-        .mockResolvedValueOnce({ data: mockCreatedAssignments, error: null });
+        .mockResolvedValueOnce({ data: mockClass2, error: null });
+      // Mock duplicate checks, one per class (no duplicates found)
+      mockSupabase.lte
+        .mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any)
+        .mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any);
+      // Mock batch insert (after two ownership and two duplicate-check selects)
+      mockSupabase.select
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(Promise.resolve({ data: mockCreatedAssignments, error: null }) as any);
 
       const result = await assignmentRouter
         .createCaller(mockContext)
@@ -340,8 +346,11 @@ describe('Assignment Router', () => {
       
       // Verify duplicate checks
       expect(mockSupabase.from).toHaveBeenCalledWith('assignments');
-      expect(mockSupabase.eq).toHaveBeenCalledWith('title', 'Math Homework 1');
-      expect(mockSupabase.eq).toHaveBeenCalledWith('title', 'Science Project');
+      expect(mockSupabase.lte).toHaveBeenCalledTimes(2);
+      expect(mockSupabase.gte).toHaveBeenCalledWith('due_date', '2024-12-25T23:59:00.000Z');
+      expect(mockSupabase.lte).toHaveBeenCalledWith('due_date', '2024-12-25T23:59:00.000Z');
+      expect(mockSupabase.gte).toHaveBeenCalledWith('due_date', '2024-12-30T23:59:00.000Z');
+      expect(mockSupabase.lte).toHaveBeenCalledWith('due_date', '2024-12-30T23:59:00.000Z');
       
       // Verify batch insert
       expect(mockSupabase.insert).toHaveBeenCalledWith([
@@ -396,10 +405,12 @@ describe('Assignment Router', () => {
         },
       }];
 
-      mockSupabase.single
-        .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: [], error: null })
-        .mockResolvedValueOnce({ data: mockCreatedAssignment, error: null });
+      mockSupabase.single.mockResolvedValueOnce({ data: mockClass, error: null });
+      mockSupabase.lte.mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any);
+      mockSupabase.select
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(Promise.resolve({ data: mockCreatedAssignment, error: null }) as any);
 
       const result = await assignmentRouter
         .createCaller(mockContext)
@@ -439,14 +450,52 @@ describe('Assignment Router', () => {
 
       mockSupabase.single
         .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: [duplicateAssignment], error: null });
+        .mockResolvedValueOnce({ data: mockClass, error: null });
+      mockSupabase.lte
+        .mockReturnValueOnce(Promise.resolve({ data: [duplicateAssignment], error: null }) as any)
+        .mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any);
 
       await expect(
         assignmentRouter.createCaller(mockContext).createBatch(validInput)
       ).rejects.toThrow('Duplicate assignment found: "Math Homework 1" is already scheduled for 2024-12-25T23:59:00Z');
     });
 
+    it('should detect a duplicate in a later row with one lookup per class', async () => {
+      const input = {
+        assignments: [
+          { title: 'Math Homework 1', due_date: '2024-12-25T23:59:00Z', class_id: 1 },
+          { title: 'Math Homework 2', due_date: '2024-12-27T23:59:00Z', class_id: 1 },
+          { title: 'Science Project', due_date: '2024-12-30T23:59:00Z', class_id: 2 },
+        ],
+      };
+
+      mockSupabase.single
+        .mockResolvedValueOnce({ data: { id: 1 }, error: null })
+        .mockResolvedValueOnce({ data: { id: 2 }, error: null });
+      mockSupabase.lte
+        // Same title in class 1 but on a different day is not a duplicate
+        .mockReturnValueOnce(Promise.resolve({
+          data: [{ id: 4, title: 'Math Homework 1', due_date: '2024-12-26T23:59:00+00:00', class_id: 1 }],
+          error: null,
+        }) as any)
+        // Postgres returns the stored timestamp in its own ISO format
+        .mockReturnValueOnce(Promise.resolve({
+          data: [{ id: 5, title: 'Science Project', due_date: '2024-12-30T23:59:00+00:00', class_id: 2 }],
+          error: null,
+        }) as any);
+
+      await expect(
+        assignmentRouter.createCaller(mockContext).createBatch(input)
+      ).rejects.toThrow('Duplicate assignment found: "Science Project" is already scheduled for 2024-12-30T23:59:00Z');
+
+      expect(mockSupabase.lte).toHaveBeenCalledTimes(2);
+      // Class 1 lookup spans both of its due dates
+      expect(mockSupabase.gte).toHaveBeenCalledWith('due_date', '2024-12-25T23:59:00.000Z');
+      expect(mockSupabase.lte).toHaveBeenCalledWith('due_date', '2024-12-27T23:59:00.000Z');
+      expect(mockSupabase.gte).toHaveBeenCalledWith('due_date', '2024-12-30T23:59:00.000Z');
+      expect(mockSupabase.insert).not.toHaveBeenCalled();
+    });
+
     it('should validate input schema - empty assignments array', async () => {
       const invalidInput = { assignments: [] };
 
@@ -510,16 +559,44 @@ describe('Assignment Router', () => {
 
       mockSupabase.single
         .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: [], error: null })
-        .mockResolvedValueOnce({ data: [], error: null })
-        .mockResolvedValueOnce({ data: null, error: { message: 'Insert failed' } });
+        .mockResolvedValueOnce({ data: mockClass, error: null });
+      mockSupabase.lte
+        .mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any)
+        .mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any);
+      mockSupabase.select
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(Promise.resolve({ data: null, error: { message: 'Insert failed' } }) as any);
 
       await expect(
         assignmentRouter.createCaller(mockContext).createBatch(validInput)
       ).rejects.toThrow('Failed to save assignments. Please try again.');
     });
 
+    it('should match titles containing quotes and commas in memory', async () => {
+      const input = {
+        assignments: [
+          { title: 'Read "Beloved", ch. 1-3', due_date: '2024-12-25T23:59:00Z', class_id: 1 },
+        ],
+      };
+
+      mockSupabase.single.mockResolvedValueOnce({ data: { id: 1 }, error: null });
+      mockSupabase.lte.mockReturnValueOnce(Promise.resolve({
+        data: [{ id: 7, title: 'Read "Beloved", ch. 1-3', due_date: '2024-12-25T23:59:00+00:00', class_id: 1 }],
+        error: null,
+      }) as any);
+
+      await expect(
+        assignmentRouter.createCaller(mockContext).createBatch(input)
+      ).rejects.toThrow('Duplicate assignment found: "Read "Beloved", ch. 1-3" is already scheduled for 2024-12-25T23:59:00Z');
+
+      // The title is never sent as a PostgREST filter value
+      expect(mockSupabase.eq).not.toHaveBeenCalledWith('title', expect.anything());
+      expect(mockSupabase.insert).not.toHaveBeenCalled();
+    });
+
     it('should handle partial insertion failures', async () => {
       const mockClass = { id: 1 };
       const partialResult = [
@@ -543,10 +620,16 @@ describe('Assignment Router', () => {
 
       mockSupabase.single
         .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: [], error: null })
-        .mockResolvedValueOnce({ data: [], error: null })
-        .mockResolvedValueOnce({ data: partialResult, error: null });
+        .mockResolvedValueOnce({ data: mockClass, error: null });
+      mockSupabase.lte
+        .mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any)
+        .mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any);
+      mockSupabase.select
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(mockSupabase)
+        .mockReturnValueOnce(Promise.resolve({ data: partialResult, error: null }) as any);
 
       await expect(
         assignmentRouter.createCaller(mockContext).createBatch(validInput)
@@ -558,8 +641,10 @@ describe('Assignment Router', () => {
 
       mockSupabase.single
         .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: mockClass, error: null })
-        .mockResolvedValueOnce({ data: null, error: { message: 'Query failed' } });
+        .mockResolvedValueOnce({ data: mockClass, error: null });
+      mockSupabase.lte
+        .mockReturnValueOnce(Promise.resolve({ data: null, error: { message: 'Query failed' } }) as any)
+        .mockReturnValueOnce(Promise.resolve({ data: [], error: null }) as any);
 
       await expect(
         assignmentRouter.createCaller(mockContext).createBatch(validInput)
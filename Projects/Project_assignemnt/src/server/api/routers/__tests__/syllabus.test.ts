@@ -0,0 +1,172 @@
+import { describe, it, expect, jest, beforeEach } from '@jest/globals';
+import { syllabusRouter } from '../syllabus';
+
+// Mock the OpenAI library
+jest.mock('@/lib/openai');
+
+// Mock Supabase
+const mockSupabase = {
+  from: jest.fn(() => mockSupabase),
+  select: jest.fn(() => mockSupabase),
+  eq: jest.fn(() => mockSupabase),
+  insert: jest.fn(() => mockSupabase),
+  single: jest.fn(),
+};
+
+jest.mock('@supabase/ssr', () => ({
+  createServerClient: jest.fn(() => mockSupabase),
+}));
+
+jest.mock('next/headers', () => ({
+  cookies: jest.fn(() => ({
+    getAll: jest.fn(() => []),
+    set: jest.fn(),
+  })),
+}));
+
+// Mock console methods to avoid noise in tests
+jest.spyOn(console, 'log').mockImplementation(() => {});
+jest.spyOn(console, 'error').mockImplementation(() => {});
+
+describe('Syllabus Router - uploadText', () => {
+  const mockContext = {
+    session: {
+      user: {
+        id: 'test-user-id',
+        email: 'test@example.com',
+      },
+    },
+  };
+
+  const validInput = {
+    class_id: 1,
+    text_content: 'CS 101 Syllabus. '.repeat(10),
+  };
+
+  const mockClass = { id: 1, name: 'CS 101' };
+
+  const parsedAssignments = [
+    { title: 'Homework 1', due_date: '2024-12-25T23:59:00Z' },
+    { title: 'Midterm Exam', due_date: '2024-12-30T23:59:00Z' },
+  ];
+
+  const toCreatedAssignment = (assignment: { title: string; due_date: string }, id: number) => ({
+    id,
+    user_id: 'test-user-id',
+    class_id: 1,
+    title: assignment.title,
+    due_date: assignment.due_date,
+    status: 'incomplete',
+  });
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+
+    const { parseSyllabusWithAI } = require('@/lib/openai');
+    parseSyllabusWithAI.mockResolvedValue({
+      assignments: parsedAssignments,
+      confidence: 0.9,
+      notes: [],
+    });
+  });
+
+  it('should create all parsed assignments with a single batch insert', async () => {
+    const createdAssignments = parsedAssignments.map((a, i) => toCreatedAssignment(a, i + 1));
+
+    mockSupabase.single.mockResolvedValueOnce({ data: mockClass, error: null });
+    mockSupabase.select
+      .mockReturnValueOnce(mockSupabase) // class lookup
+      .mockReturnValueOnce(Promise.resolve({ data: createdAssignments, error: null }) as any);
+
+    const result = await syllabusRouter
+      .createCaller(mockContext)
+      .uploadText(validInput);
+
+    expect(result.success).toBe(true);
+    expect(result.assignmentsCreated).toBe(2);
+    expect(result.createdAssignments).toEqual(createdAssignments);
+    expect(mockSupabase.insert).toHaveBeenCalledTimes(1);
+    expect(mockSupabase.insert).toHaveBeenCalledWith([
+      {
+        user_id: 'test-user-id',
+        class_id: 1,
+        title: 'Homework 1',
+        due_date: '2024-12-25T23:59:00Z',
+        status: 'incomplete',
+      },
+      {
+        user_id: 'test-user-id',
+        class_id: 1,
+        title: 'Midterm Exam',
+        due_date: '2024-12-30T23:59:00Z',
+        status: 'incomplete',
+      },
+    ]);
+  });
+
+  it('should fall back to per-row inserts and keep valid rows when the batch fails', async () => {
+    mockSupabase.single
+      .mockResolvedValueOnce({ data: mockClass, error: null })
+      // First row is rejected, second row succeeds
+      .mockResolvedValueOnce({ data: null, error: { code: '22007', message: 'invalid input syntax for type timestamp' } })
+      .mockResolvedValueOnce({ data: toCreatedAssignment(parsedAssignments[1], 2), error: null });
+    mockSupabase.select
+      .mockReturnValueOnce(mockSupabase) // class lookup
+      .mockReturnValueOnce(
+        Promise.resolve({
+          data: null,
+          error: { code: '22007', message: 'invalid input syntax for type timestamp' },
+        }) as any
+      );
+
+    const result = await syllabusRouter
+      .createCaller(mockContext)
+      .uploadText(validInput);
+
+    expect(result.success).toBe(true);
+    expect(result.assignmentsFound).toBe(2);
+    expect(result.assignmentsCreated).toBe(1);
+    expect(result.createdAssignments).toEqual([toCreatedAssignment(parsedAssignments[1], 2)]);
+
+    // One batch attempt followed by one insert per assignment
+    expect(mockSupabase.insert).toHaveBeenCalledTimes(3);
+    expect(mockSupabase.insert).toHaveBeenLastCalledWith({
+      user_id: 'test-user-id',
+      class_id: 1,
+      title: 'Midterm Exam',
+      due_date: '2024-12-30T23:59:00Z',
+      status: 'incomplete',
+    });
+  });
+
+  it('should throw when no assignments could be saved', async () => {
+    const rowError = { code: '23502', message: 'null value violates not-null constraint' };
+
+    mockSupabase.single
+      .mockResolvedValueOnce({ data: mockClass, error: null })
+      .mockResolvedValueOnce({ data: null, error: rowError })
+      .mockResolvedValueOnce({ data: null, error: rowError });
+    mockSupabase.select
+      .mockReturnValueOnce(mockSupabase) // class lookup
+      .mockReturnValueOnce(Promise.resolve({ data: null, error: rowError }) as any);
+
+    await expect(
+      syllabusRouter.createCaller(mockContext).uploadText(validInput)
+    ).rejects.toThrow('Failed to save assignments. Please try again.');
+    expect(mockSupabase.insert).toHaveBeenCalledTimes(3);
+  });
+
+  it('should not retry row by row when the batch fails for a non-data reason', async () => {
+    mockSupabase.single.mockResolvedValueOnce({ data: mockClass, error: null });
+    mockSupabase.select
+      .mockReturnValueOnce(mockSupabase) // class lookup
+      .mockReturnValueOnce(
+        Promise.resolve({ data: null, error: { code: '42501', message: 'permission denied' } }) as any
+      );
+
+    await expect(
+      syllabusRouter.createCaller(mockContext).uploadText(validInput)
+    ).rejects.toThrow('Failed to save assignments. Please try again.');
+    expect(mockSupabase.insert).toHaveBeenCalledTimes(1);
+  });
+});
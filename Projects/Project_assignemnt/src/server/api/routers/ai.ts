@@ -3,7 +3,10 @@ import { createTRPCRouter, protectedProcedure } from '@/server/api/trpc';
 import { createServerClient } from '@supabase/ssr';
 import { cookies } from 'next/headers';
 import { parseSyllabusWithAI, validateOpenAIConfig, generateStructuredPromptWithAI } from '@/lib/openai';
-import type { Class, AssignmentPlan, AssignmentWithClass } from '@/types';
+import type { Class, AssignmentPlan } from '@/types';
+
+// Characters stripped from syllabus content before it is sent to the AI
+const UNSAFE_SYLLABUS_CHARS = /[^\w\s\-.,!?;:()\[\]{}\/\\'"@#$%&*+=<>|\n\r\t]/g;
 
 export const aiRouter = createTRPCRouter({
   // Parse syllabus content and extract assignments
@@ -63,7 +66,7 @@ export const aiRouter = createTRPCRouter({
 
         // Sanitize input content to prevent prompt injection
         const sanitizedContent = input.content
-          .replace(/[^\w\s\-.,!?;:()\[\]{}\/\\'"@#$%&*+=<>|\n\r\t]/g, '') // Remove special characters that could be used for injection
+          .replace(UNSAFE_SYLLABUS_CHARS, '') // Remove special characters that could be used for injection
           .trim();
 
         // Log parsing attempt for debugging and monitoring
@@ -170,10 +173,18 @@ export const aiRouter = createTRPCRouter({
           throw new Error('All assignments must belong to the specified class');
         }
 
-        // Additional business logic validation
-        const duplicateTitles = input.assignments
-          .map(a => a.title.toLowerCase())
-          .filter((title, index, arr) => arr.indexOf(title) !== index);
+        // Additional business logic validation - track seen titles in a Set so
+        // duplicate detection is a single pass instead of an indexOf scan per title
+        const seenTitles = new Set<string>();
+        const duplicateTitles: string[] = [];
+        for (const assignment of input.assignments) {
+          const title = assignment.title.toLowerCase();
+          if (seenTitles.has(title)) {
+            duplicateTitles.push(title);
+          } else {
+            seenTitles.add(title);
+          }
+        }
 
         if (duplicateTitles.length > 0) {
           console.warn('Duplicate assignment titles detected:', duplicateTitles);
@@ -300,12 +311,25 @@ export const aiRouter = createTRPCRouter({
           }
         );
 
-        // Get assignment plan with original instructions
-        const { data: plan, error: planError } = await supabase
-          .from('assignment_plans')
-          .select('id, assignment_id, original_instructions, prompt_status')
-          .eq('assignment_id', input.assignmentId)
-          .single();
+        // Fetch the assignment plan and verify assignment ownership in parallel -
+        // the two lookups are independent, so there is no reason to wait on one
+        // round-trip before issuing the other
+        const [
+          { data: plan, error: planError },
+          { data: assignment, error: assignmentError },
+        ] = await Promise.all([
+          supabase
+            .from('assignment_plans')
+            .select('id, assignment_id, original_instructions, prompt_status')
+            .eq('assignment_id', input.assignmentId)
+            .single(),
+          supabase
+            .from('assignments')
+            .select('id, user_id, title')
+            .eq('id', input.assignmentId)
+            .eq('user_id', ctx.session.user.id)
+            .single(),
+        ]);
 
         if (planError || !plan) {
           console.error('Assignment plan not found:', planError);
@@ -318,14 +342,6 @@ export const aiRouter = createTRPCRouter({
           throw new Error('Assignment plan not found. Please create a plan first.');
         }
 
-        // Verify assignment ownership
-        const { data: assignment, error: assignmentError } = await supabase
-          .from('assignments')
-          .select('id, user_id, title')
-          .eq('id', input.assignmentId)
-          .eq('user_id', ctx.session.user.id)
-          .single();
-
         if (assignmentError || !assignment) {
           console.error('Assignment authorization failed:', assignmentError);
           throw new Error('Assignment not found or access denied');
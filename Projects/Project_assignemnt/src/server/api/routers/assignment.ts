@@ -99,6 +99,47 @@ const verifyClassOwnership = async (supabase: any, classId: number, userId: stri
   return classData;
 };
 
+// Utility function to order assignments for display: incomplete assignments first
+// (overdue, then by due date ascending), completed assignments at the bottom
+const sortAssignments = (assignments: AssignmentWithClass[]) => {
+  // Capture "now" once so every comparison uses the same reference point
+  const now = Date.now();
+
+  // Parse each due date once up front rather than twice per comparison
+  const dueTimes = new Map(
+    assignments.map(assignment => [assignment, new Date(assignment.due_date).getTime()])
+  );
+
+  return assignments.sort((a, b) => {
+    const aTime = dueTimes.get(a)!;
+    const bTime = dueTimes.get(b)!;
+
+    // If both have same status, sort by due date logic
+    if (a.status === b.status) {
+      if (a.status === 'complete') {
+        // For completed assignments, maintain due date order (doesn't matter much since they're at bottom)
+        return aTime - bTime;
+      } else {
+        // For incomplete assignments: overdue first, then by due date ascending
+        const aOverdue = aTime < now;
+        const bOverdue = bTime < now;
+
+        if (aOverdue && !bOverdue) return -1; // a is overdue, b is not
+        if (!aOverdue && bOverdue) return 1;  // b is overdue, a is not
+
+        // Both overdue or both upcoming - sort by due date
+        return aTime - bTime;
+      }
+    }
+
+    // Different statuses: incomplete comes first
+    if (a.status === 'incomplete' && b.status === 'complete') return -1;
+    if (a.status === 'complete' && b.status === 'incomplete') return 1;
+
+    return 0;
+  });
+};
+
 export const assignmentRouter = createTRPCRouter({
   // Get a single assignment by ID for the authenticated user
   getById: protectedProcedure
@@ -143,38 +184,7 @@ export const assignmentRouter = createTRPCRouter({
 
       const assignmentList = (assignments as unknown as AssignmentWithClass[]) || [];
       
-      // Custom sorting: Incomplete assignments first (overdue then by due date), completed at bottom
-      const sortedAssignments = assignmentList.sort((a, b) => {
-        const now = new Date();
-        const aDate = new Date(a.due_date);
-        const bDate = new Date(b.due_date);
-        
-        // If both have same status, sort by due date logic
-        if (a.status === b.status) {
-          if (a.status === 'complete') {
-            // For completed assignments, maintain due date order (doesn't matter much since they're at bottom)
-            return aDate.getTime() - bDate.getTime();
-          } else {
-            // For incomplete assignments: overdue first, then by due date ascending
-            const aOverdue = aDate < now;
-            const bOverdue = bDate < now;
-            
-            if (aOverdue && !bOverdue) return -1; // a is overdue, b is not
-            if (!aOverdue && bOverdue) return 1;  // b is overdue, a is not
-            
-            // Both overdue or both upcoming - sort by due date
-            return aDate.getTime() - bDate.getTime();
-          }
-        }
-        
-        // Different statuses: incomplete comes first
-        if (a.status === 'incomplete' && b.status === 'complete') return -1;
-        if (a.status === 'complete' && b.status === 'incomplete') return 1;
-        
-        return 0;
-      });
-
-      return sortedAssignments;
+      return sortAssignments(assignmentList);
     } catch (error) {
       console.error('Assignment query error:', error);
       throw new Error('Failed to fetch assignments');
@@ -201,38 +211,7 @@ export const assignmentRouter = createTRPCRouter({
 
         const assignmentList = (assignments as unknown as AssignmentWithClass[]) || [];
         
-        // Apply same sorting logic as getAll
-        const sortedAssignments = assignmentList.sort((a, b) => {
-          const now = new Date();
-          const aDate = new Date(a.due_date);
-          const bDate = new Date(b.due_date);
-          
-          // If both have same status, sort by due date logic
-          if (a.status === b.status) {
-            if (a.status === 'complete') {
-              // For completed assignments, maintain due date order
-              return aDate.getTime() - bDate.getTime();
-            } else {
-              // For incomplete assignments: overdue first, then by due date ascending
-              const aOverdue = aDate < now;
-              const bOverdue = bDate < now;
-              
-              if (aOverdue && !bOverdue) return -1; // a is overdue, b is not
-              if (!aOverdue && bOverdue) return 1;  // b is overdue, a is not
-              
-              // Both overdue or both upcoming - sort by due date
-              return aDate.getTime() - bDate.getTime();
-            }
-          }
-          
-          // Different statuses: incomplete comes first
-          if (a.status === 'incomplete' && b.status === 'complete') return -1;
-          if (a.status === 'complete' && b.status === 'incomplete') return 1;
-          
-          return 0;
-        });
-
-        return sortedAssignments;
+        return sortAssignments(assignmentList);
       } catch (error) {
         console.error('Assignment by class query error:', error);
         throw new Error(`Failed to fetch assignments for class ${input.classId}`);
@@ -412,22 +391,43 @@ export const assignmentRouter = createTRPCRouter({
           uniqueClassIds.map(classId => verifyClassOwnership(supabase, classId, userId))
         );
 
-        // Check for duplicates within the same class based on title and due_date
-        for (const assignment of input.assignments) {
-          const { data: existingAssignments, error: duplicateError } = await supabase
-            .from('assignments')
-            .select('id, title, due_date, class_id')
-            .eq('user_id', userId)
-            .eq('class_id', assignment.class_id)
-            .eq('title', assignment.title)
-            .eq('due_date', assignment.due_date);
+        // Check for duplicates within the same class based on title and due_date.
+        // Fetch candidates with one query per class rather than one per assignment,
+        // narrowed to the batch's due date range, then match title and due_date in
+        // memory. Filtering on titles would need quoting PostgREST does not fully do
+        const duplicateChecks = await Promise.all(
+          uniqueClassIds.map(classId => {
+            const dueTimes = input.assignments
+              .filter(a => a.class_id === classId)
+              .map(a => new Date(a.due_date).getTime());
+            return supabase
+              .from('assignments')
+              .select('id, title, due_date, class_id')
+              .eq('user_id', userId)
+              .eq('class_id', classId)
+              .gte('due_date', new Date(Math.min(...dueTimes)).toISOString())
+              .lte('due_date', new Date(Math.max(...dueTimes)).toISOString());
+          })
+        );
 
+        // Index existing assignments by class, title and due timestamp. Due dates are
+        // compared as timestamps since Postgres may return a different ISO format
+        const existingKeys = new Set<string>();
+        for (const { data: existingAssignments, error: duplicateError } of duplicateChecks) {
           if (duplicateError) {
             console.error('Error checking for duplicates:', duplicateError);
             throw new Error('Failed to validate assignment uniqueness');
           }
 
-          if (existingAssignments && existingAssignments.length > 0) {
+          for (const existing of existingAssignments || []) {
+            existingKeys.add(`${existing.class_id}|${existing.title}|${new Date(existing.due_date).getTime()}`);
+          }
+        }
+
+        // Inspect assignments in input order so the reported duplicate is deterministic
+        for (const assignment of input.assignments) {
+          const key = `${assignment.class_id}|${assignment.title}|${new Date(assignment.due_date).getTime()}`;
+          if (existingKeys.has(key)) {
             throw new Error(`Duplicate assignment found: "${assignment.title}" is already scheduled for ${assignment.due_date}`);
           }
         }
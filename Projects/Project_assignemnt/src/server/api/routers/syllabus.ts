@@ -3,6 +3,7 @@ import { createTRPCRouter, protectedProcedure } from '@/server/api/trpc';
 import { createServerClient } from '@supabase/ssr';
 import { cookies } from 'next/headers';
 import { parseSyllabusWithAI } from '@/lib/openai';
+import type { Assignment } from '@/types';
 
 // Helper function to create server Supabase client
 const createSupabaseServerClient = () => {
@@ -29,6 +30,11 @@ const createSupabaseServerClient = () => {
   );
 };
 
+// Postgres data exception (22xxx) and integrity constraint violation (23xxx)
+// codes are raised by individual rows rather than the request as a whole
+const isRowDataError = (error: { code?: string }) =>
+  !!error.code && (error.code.startsWith('22') || error.code.startsWith('23'));
+
 // Validation schema
 const syllabusUploadSchema = z.object({
   class_id: z.number().min(1, 'Please select a class'),
@@ -65,35 +71,63 @@ export const syllabusRouter = createTRPCRouter({
 
         console.log('✅ AI parsing completed, found', aiResponse.assignments.length, 'assignments');
 
-        // Create assignments in the database
-        const createdAssignments = [];
-        
-        for (const assignment of aiResponse.assignments) {
-          try {
-            const { data: newAssignment, error: assignmentError } = await supabase
-              .from('assignments')
-              .insert({
-                user_id: ctx.session.user.id,
-                class_id: input.class_id,
-                title: assignment.title,
-                due_date: assignment.due_date,
-                status: 'incomplete',
-              })
-              .select('*')
-              .single();
-
-            if (assignmentError) {
-              console.error('Failed to create assignment:', assignment.title, assignmentError);
-              // Continue with other assignments even if one fails
-              continue;
+        // Create assignments in the database with a single batch insert
+        // instead of one round-trip per parsed assignment
+        let createdAssignments: Assignment[] = [];
+
+        if (aiResponse.assignments.length > 0) {
+          const assignmentsToInsert = aiResponse.assignments.map(assignment => ({
+            user_id: ctx.session.user.id,
+            class_id: input.class_id,
+            title: assignment.title,
+            due_date: assignment.due_date,
+            status: 'incomplete' as const,
+          }));
+
+          const { data: newAssignments, error: insertError } = await supabase
+            .from('assignments')
+            .insert(assignmentsToInsert)
+            .select('*');
+
+          if (!insertError) {
+            createdAssignments = (newAssignments || []) as Assignment[];
+            console.log('✅ Created', createdAssignments.length, 'assignments');
+          } else if (!isRowDataError(insertError)) {
+            // Network, auth or RLS failures are not caused by a single row, and the
+            // batch may have committed anyway, so retrying could insert duplicates
+            console.error('Failed to create assignments:', insertError);
+            throw new Error('Failed to save assignments. Please try again.');
+          } else {
+            // A single bad row rejects the whole batch, so fall back to
+            // per-row inserts to keep every assignment that can be saved
+            console.error('Batch insert failed, retrying assignments individually:', insertError);
+
+            for (const assignmentToInsert of assignmentsToInsert) {
+              try {
+                const { data: newAssignment, error: assignmentError } = await supabase
+                  .from('assignments')
+                  .insert(assignmentToInsert)
+                  .select('*')
+                  .single();
+
+                if (assignmentError) {
+                  console.error('Failed to create assignment:', assignmentToInsert.title, assignmentError);
+                  // Continue with other assignments even if one fails
+                  continue;
+                }
+
+                createdAssignments.push(newAssignment as Assignment);
+                console.log('✅ Created assignment:', assignmentToInsert.title);
+              } catch (error) {
+                console.error('Error creating assignment:', assignmentToInsert.title, error);
+                // Continue with other assignments
+                continue;
+              }
             }
 
-            createdAssignments.push(newAssignment);
-            console.log('✅ Created assignment:', assignment.title);
-          } catch (error) {
-            console.error('Error creating assignment:', assignment.title, error);
-            // Continue with other assignments
-            continue;
+            if (createdAssignments.length === 0) {
+              throw new Error('Failed to save assignments. Please try again.');
+            }
           }
         }
 